@@ -1,203 +1,339 @@
+import functools
 import inspect
+import sys
+import types
+import typing
+import weakref
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, get_origin, get_args, Union
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_origin, get_args, Union
 
-from mcp_types import MCPType, MCPInt, MCPFloat, MCPString, MCPBool, MCPArray, MCPObject, MCPUnion, MCPAny, MCP_INT, MCP_FLOAT, MCP_STRING, MCP_BOOL, MCP_ANY
+from mcp_types import MCPType, MCPInt, MCPFloat, MCPString, MCPBool, MCPArray, MCPPrimitiveArray, MCPObject, MCPUnion, MCPAny, MCP_INT, MCP_FLOAT, MCP_STRING, MCP_BOOL, MCP_ANY
 from function_schema import Parameter, FunctionSchema
 
 
-class TypeConverter:
-    def convert(self, annotation) -> MCPType:
-        if annotation is int:
-            return MCP_INT
-        elif annotation is float:
-            return MCP_FLOAT
-        elif annotation is str:
-            return MCP_STRING
-        elif annotation is bool:
-            return MCP_BOOL
-        
-        origin = get_origin(annotation)
-        args = get_args(annotation)
-        
-        if origin is list:
-            item_type = self.convert(args[0]) if args else MCP_STRING
-            return MCPArray(items=item_type)
-        elif origin is dict:
-            return MCPObject(properties={}, required=[], description="dictionary object")
-        elif origin is Union:
-            non_none_args = [arg for arg in args if arg is not type(None)]
-            if len(non_none_args) == 1:
-                return self.convert(non_none_args[0])
-            else:
-                variants = tuple(self.convert(arg) for arg in non_none_args)
-                return MCPUnion(variants=variants)
-        
-        if inspect.isclass(annotation):
-            return self._convert_class(annotation)
-        
-        return MCP_ANY
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _signature(func: Callable) -> Optional[inspect.Signature]:
+    """cached inspect.signature, returns none for callables that can't be introspected"""
+    try:
+        return _cached_signature(func)
+    except ValueError:
+        return None
+    except TypeError:
+        # unhashable callables can't go through the cache
+        try:
+            return inspect.signature(func)
+        except (ValueError, TypeError):
+            return None
+
+
+# (name, annotation, default) - inspect.Parameter.empty marks a missing annotation or default
+ParamSpec = Tuple[str, Any, Any]
+
+_EMPTY = inspect.Parameter.empty
+_VARARG_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _code_specs(func: Callable) -> Optional[List[ParamSpec]]:
+    """read a plain python function's parameters straight off __code__, without building a Signature"""
+    if type(func) is not types.FunctionType:
+        return None
+    code = func.__code__
+    # varargs, functools.wraps chains and explicit __signature__ need inspect.signature's handling
+    if code.co_flags & _VARARG_FLAGS or '__wrapped__' in func.__dict__ or '__signature__' in func.__dict__:
+        return None
     
-    def convert_from_value(self, value) -> MCPType:
-        """convert a runtime value to its corresponding mcptype - used by value serializer"""
-        if isinstance(value, int):
-            return MCP_INT
-        elif isinstance(value, float):
-            return MCP_FLOAT
-        elif isinstance(value, str):
-            return MCP_STRING
-        elif isinstance(value, bool):
-            return MCP_BOOL
-        elif isinstance(value, (list, tuple)):
-            if not value:
-                return MCPArray(items=MCP_STRING)
-            item_type = self.convert_from_value(value[0])
-            return MCPArray(items=item_type)
-        elif isinstance(value, dict):
-            return MCPObject(
-                properties={k: self.convert_from_value(v) for k, v in value.items()},
-                required=list(value.keys())
-            )
-        elif hasattr(value, '__dict__'):
-            return self._convert_object_from_value(value)
+    nargs = code.co_argcount
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    annotations = func.__annotations__
+    first_default = nargs - len(defaults)
+    
+    specs = []
+    for i, name in enumerate(code.co_varnames[:nargs + code.co_kwonlyargcount]):
+        if i < nargs:
+            default = defaults[i - first_default] if i >= first_default else _EMPTY
         else:
-            return MCP_ANY
+            default = kwdefaults.get(name, _EMPTY)
+        specs.append((name, annotations.get(name, _EMPTY), default))
+    return specs
+
+
+def _parameter_specs(func: Callable) -> Optional[List[ParamSpec]]:
+    """parameters of func as specs, none for callables that can't be introspected"""
+    specs = _code_specs(func)
+    if specs is not None:
+        return specs
+    sig = _signature(func)
+    if sig is None:
+        return None
+    return [(name, param.annotation, param.default) for name, param in sig.parameters.items()]
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_type_hints(func: Callable) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(func)
+    except Exception:
+        pass
     
-    def _convert_object_from_value(self, obj) -> MCPObject:
-        """convert a runtime object to mcpobject"""
-        obj_dict = obj.__dict__
-        properties = {}
-        required = []
-        
-        for attr_name, attr_value in obj_dict.items():
-            properties[attr_name] = self.convert_from_value(attr_value)
-            required.append(attr_name)
-        
+    # one unresolvable forward reference fails the whole call - resolve the rest one by one
+    hints = {}
+    globalns = getattr(func, '__globals__', {})
+    for name, annotation in (getattr(func, '__annotations__', None) or {}).items():
+        try:
+            hints[name] = eval(annotation, globalns) if isinstance(annotation, str) else annotation
+        except Exception:
+            continue
+    return hints
+
+
+def _hints_target(func: Callable) -> Optional[Callable]:
+    """the python function whose annotations describe func's parameters, none if there isn't one"""
+    while True:
+        if type(func) is types.FunctionType:
+            return func
+        if type(func) is types.MethodType:
+            func = func.__func__
+        elif type(func) is functools.partial:
+            func = func.func
+        elif not inspect.isclass(func) and type(getattr(type(func), '__call__', None)) is types.FunctionType:
+            # a callable instance is described by its class's __call__, not the class-level attribute annotations
+            func = type(func).__call__
+        else:
+            return None
+
+
+def _type_hints(func: Callable) -> Dict[str, Any]:
+    """resolved annotations of func, evaluated once per function"""
+    # other callables keep their signature's raw annotations
+    target = _hints_target(func)
+    if target is None:
+        return {}
+    try:
+        return _cached_type_hints(target)
+    except TypeError:
+        return {}
+
+
+_PRIMITIVE_MAP = {int: MCP_INT, float: MCP_FLOAT, str: MCP_STRING, bool: MCP_BOOL}
+
+
+def _handle_list(args: tuple) -> MCPType:
+    item_type = _convert_annotation(args[0]) if args else MCP_STRING
+    if args and args[0] in (int, float, str, bool):
+        return MCPPrimitiveArray(items=item_type)
+    return MCPArray(items=item_type)
+
+
+def _handle_tuple(args: tuple) -> MCPType:
+    # Tuple[X, ...] and homogeneous tuples become arrays of X, anything else an array of any
+    item_args = [arg for arg in args if arg is not Ellipsis]
+    if not item_args:
+        return MCPArray(items=MCP_STRING)
+    if all(arg == item_args[0] for arg in item_args):
+        return MCPArray(items=_convert_annotation(item_args[0]))
+    return MCPArray(items=MCP_ANY)
+
+
+def _handle_dict(args: tuple) -> MCPType:
+    return MCPObject(properties={}, required=[], description="dictionary object")
+
+
+def _handle_union(args: tuple) -> MCPType:
+    non_none_args = [arg for arg in args if arg is not type(None)]
+    if len(non_none_args) == 1:
+        return _convert_annotation(non_none_args[0])
+    variants = tuple(_convert_annotation(arg) for arg in non_none_args)
+    return MCPUnion(variants=variants)
+
+
+_ORIGIN_MAP = {list: _handle_list, tuple: _handle_tuple, dict: _handle_dict, Union: _handle_union}
+
+
+def _build_annotation_type(annotation) -> MCPType:
+    primitive = _PRIMITIVE_MAP.get(annotation)
+    if primitive is not None:
+        return primitive
+    
+    handler = _ORIGIN_MAP.get(get_origin(annotation))
+    if handler is not None:
+        return handler(get_args(annotation))
+    
+    if inspect.isclass(annotation):
+        return _convert_class(annotation)
+    
+    return MCP_ANY
+
+
+def _annotation_key(annotation) -> Any:
+    """cache key for an annotation - typing compares unions regardless of member order, this key keeps it"""
+    origin = get_origin(annotation)
+    if origin is None:
+        return annotation
+    return (origin, tuple([_annotation_key(arg) for arg in get_args(annotation)]))
+
+
+# annotation key -> mcptype; the conversion only looks at the origin and args, so equal keys convert alike.
+# bounded like the lru_cache it replaced, the oldest entry goes first
+_annotation_types: Dict[Any, MCPType] = {}
+_ANNOTATION_CACHE_SIZE = 1024
+
+# keys being converted right now - a class whose __init__ names the class itself (parent: "Node") meets its own key again
+_converting: set = set()
+
+
+def _convert_annotation(annotation) -> MCPType:
+    """convert a type annotation to its mcptype"""
+    # the same annotations recur across many functions, so memoize on their structure
+    try:
+        key = _annotation_key(annotation)
+        mcp_type = _annotation_types.get(key)
+    except TypeError:
+        # unhashable parts, e.g. the parameter list of Callable[[int], str]
+        return _build_annotation_type(annotation)
+    if mcp_type is not None:
+        return mcp_type
+    
+    if key in _converting:
+        # the recursive reference becomes any, as the unresolved string annotation did
+        return MCP_ANY
+    _converting.add(key)
+    try:
+        mcp_type = _build_annotation_type(annotation)
+    finally:
+        _converting.discard(key)
+    
+    if len(_annotation_types) >= _ANNOTATION_CACHE_SIZE:
+        del _annotation_types[next(iter(_annotation_types))]
+    _annotation_types[key] = mcp_type
+    return mcp_type
+
+
+def _convert_value(value) -> MCPType:
+    """convert a runtime value to its corresponding mcptype - used by value serializer"""
+    # exact types are the common case and need no mro walk
+    primitive = _PRIMITIVE_MAP.get(type(value))
+    if primitive is not None:
+        return primitive
+    
+    # containers next - isinstance on an exact list/dict is a single type comparison,
+    # subclasses of the primitives only pay for their checks after that
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return MCPArray(items=MCP_STRING)
+        item_type = _convert_value(value[0])
+        return MCPArray(items=item_type)
+    elif isinstance(value, dict):
         return MCPObject(
-            properties=properties,
-            required=required,
-            type_name=type(obj).__name__
+            properties={k: _convert_value(v) for k, v in value.items()},
+            required=list(value.keys())
         )
+    elif isinstance(value, int):
+        return MCP_INT
+    elif isinstance(value, float):
+        return MCP_FLOAT
+    elif isinstance(value, str):
+        return MCP_STRING
+    elif hasattr(value, '__dict__'):
+        return _convert_object_from_value(value)
+    else:
+        return MCP_ANY
+
+
+def _convert_object_from_value(obj) -> MCPObject:
+    """convert a runtime object to mcpobject"""
+    obj_dict = obj.__dict__
+    properties = {}
+    required = []
     
-    def _convert_class(self, cls: type) -> MCPObject:
-        try:
-            sig = inspect.signature(cls.__init__)
-            properties = {}
-            required = []
-            
-            for param_name, param in sig.parameters.items():
-                if param_name == 'self':
-                    continue
-                
-                if param.annotation != inspect.Parameter.empty:
-                    properties[param_name] = self.convert(param.annotation)
-                else:
-                    properties[param_name] = MCP_ANY
-                
-                if param.default == inspect.Parameter.empty:
-                    required.append(param_name)
-            
-            return MCPObject(
-                properties=properties,
-                required=required,
-                type_name=cls.__name__,
-                description=cls.__doc__
-            )
-        except (ValueError, TypeError):
-            return MCPObject(
-                properties={},
-                required=[],
-                type_name=cls.__name__,
-                description=cls.__doc__ or f"{cls.__name__} object"
-            )
+    for attr_name, attr_value in obj_dict.items():
+        properties[attr_name] = _convert_value(attr_value)
+        required.append(attr_name)
+    
+    return MCPObject(
+        properties=properties,
+        required=required,
+        type_name=type(obj).__name__
+    )
 
 
-class ParameterExtractor(ABC):
-    @abstractmethod
-    def can_handle(self, func: Callable) -> bool:
-        pass
+def _convert_class(cls: type) -> MCPObject:
+    specs = _parameter_specs(cls.__init__)
+    if specs is not None:
+        parameters = _parameters_from_specs(cls.__init__, specs)
+        return MCPObject(
+            properties={param.name: param.type for param in parameters},
+            required=[param.name for param in parameters if param.is_required],
+            type_name=cls.__name__,
+            description=cls.__doc__
+        )
+    return MCPObject(
+        properties={},
+        required=[],
+        type_name=cls.__name__,
+        description=cls.__doc__ or f"{cls.__name__} object"
+    )
+
+
+class TypeConverter:
+    """object facade over the module-level conversion functions, which hold no state"""
+    convert = staticmethod(_convert_annotation)
+    convert_from_value = staticmethod(_convert_value)
+
+
+def _parameters_from_specs(target: Callable, specs: List[ParamSpec], skip_self: bool = True) -> List[Parameter]:
+    """turn the parameter specs of target into parameters - shared by the extractors and class conversion"""
+    parameters = []
+    hints = _type_hints(target)
+    
+    for param_name, raw_annotation, default in specs:
+        if param_name == 'self' and skip_self:
+            continue
+        
+        annotation = hints.get(param_name, raw_annotation)
+        param_type = _convert_annotation(annotation) if annotation != _EMPTY else MCP_ANY
+        is_required = default == _EMPTY
+        default_value = default if default != _EMPTY else None
+        
+        parameters.append(Parameter(
+            name=sys.intern(param_name),
+            type=param_type,
+            is_required=is_required,
+            default_value=default_value
+        ))
     
+    return parameters
+
+
+class ParameterExtractor(ABC):
     @abstractmethod
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
         pass
     
-    def _extract_from_signature(self, sig: inspect.Signature, type_converter: TypeConverter, skip_self: bool = True) -> List[Parameter]:
+    def _extract_from_specs(self, target: Callable, specs: List[ParamSpec], skip_self: bool = True) -> List[Parameter]:
         """common parameter extraction logic used by multiple extractors"""
-        parameters = []
-        
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self' and skip_self:
-                continue
-            
-            param_type = type_converter.convert(param.annotation) if param.annotation != inspect.Parameter.empty else MCP_ANY
-            is_required = param.default == inspect.Parameter.empty
-            default_value = param.default if param.default != inspect.Parameter.empty else None
-            
-            parameters.append(Parameter(
-                name=param_name,
-                type=param_type,
-                is_required=is_required,
-                default_value=default_value
-            ))
-        
-        return parameters
+        return _parameters_from_specs(target, specs, skip_self)
 
 
 class SignatureExtractor(ParameterExtractor):
-    def can_handle(self, func: Callable) -> bool:
-        try:
-            inspect.signature(func)
-            return True
-        except (ValueError, TypeError):
-            return False
-    
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
-        sig = inspect.signature(func)
-        return self._extract_from_signature(sig, type_converter)
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
+        return self._extract_from_specs(getattr(func, 'py_func', func), specs)
 
 
 class ClassExtractor(ParameterExtractor):
-    def can_handle(self, func: Callable) -> bool:
-        if not inspect.isclass(func):
-            return False
-        try:
-            inspect.signature(func.__init__)
-            return True
-        except (ValueError, TypeError):
-            return False
-    
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
-        sig = inspect.signature(func.__init__)
-        return self._extract_from_signature(sig, type_converter)
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
+        return self._extract_from_specs(func.__init__, _parameter_specs(func.__init__))
 
 
 class UnboundMethodExtractor(ParameterExtractor):
-    def can_handle(self, func: Callable) -> bool:
-        # check if it's an unbound method (function defined in a class but not bound to an instance)
-        if not hasattr(func, '__qualname__'):
-            return False
-        
-        # unbound methods have qualname like "ClassName.method_name"
-        qualname_parts = func.__qualname__.split('.')
-        if len(qualname_parts) < 2:
-            return False
-        
-        # must not be a bound method (no __self__ attribute)
-        if hasattr(func, '__self__'):
-            return False
-            
-        try:
-            sig = inspect.signature(func)
-            # check if first parameter is named 'self'
-            params = list(sig.parameters.keys())
-            return len(params) > 0 and params[0] == 'self'
-        except (ValueError, TypeError):
-            return False
-    
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
-        sig = inspect.signature(func)
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
         # for unbound methods, don't skip self - it should be exposed as a parameter
-        parameters = self._extract_from_signature(sig, type_converter, skip_self=False)
+        parameters = self._extract_from_specs(func, specs, skip_self=False)
         
         # mark the self parameter as positional and add usage documentation
         for i, param in enumerate(parameters):
@@ -219,18 +355,8 @@ class UnboundMethodExtractor(ParameterExtractor):
 
 
 class BoundMethodExtractor(ParameterExtractor):
-    def can_handle(self, func: Callable) -> bool:
-        if not (hasattr(func, '__self__') and hasattr(func, '__func__')):
-            return False
-        try:
-            inspect.signature(func.__func__)
-            return True
-        except (ValueError, TypeError):
-            return False
-    
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
-        sig = inspect.signature(func.__func__)
-        return self._extract_from_signature(sig, type_converter, skip_self=True)
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
+        return self._extract_from_specs(func.__func__, _parameter_specs(func.__func__), skip_self=True)
 
 
 class BuiltinExtractor(ParameterExtractor):
@@ -246,36 +372,88 @@ class BuiltinExtractor(ParameterExtractor):
             Parameter('value', MCP_ANY, True, description='value to set', is_positional=True)
         ]
     }
+    BUILTIN_NAMES = frozenset(BUILTIN_SCHEMAS)
     
-    def can_handle(self, func: Callable) -> bool:
-        name = getattr(func, '__name__', '')
-        return name in self.BUILTIN_SCHEMAS
-    
-    def extract_parameters(self, func: Callable, type_converter: TypeConverter) -> List[Parameter]:
+    def extract_parameters(self, func: Callable, specs: Optional[List[ParamSpec]]) -> List[Parameter]:
         name = getattr(func, '__name__', '')
         return self.BUILTIN_SCHEMAS.get(name, [])
 
 
+class CallableKind(Enum):
+    BUILTIN = "builtin"
+    BOUND = "bound"
+    CLASS = "class"
+    UNBOUND = "unbound"
+    SIGNATURE = "signature"
+    OPAQUE = "opaque"
+
+
+def _classify(func: Callable, specs: Optional[List[ParamSpec]]) -> CallableKind:
+    """work out once which extractor applies to a callable"""
+    if getattr(func, '__name__', '') in BuiltinExtractor.BUILTIN_NAMES:
+        return CallableKind.BUILTIN
+    
+    if hasattr(func, '__self__'):
+        if hasattr(func, '__func__') and _parameter_specs(func.__func__) is not None:
+            return CallableKind.BOUND
+    elif inspect.isclass(func):
+        if _parameter_specs(func.__init__) is not None:
+            return CallableKind.CLASS
+    elif specs and '.' in getattr(func, '__qualname__', ''):
+        # unbound methods have qualname like "ClassName.method_name" and take self first
+        if specs[0][0] == 'self':
+            return CallableKind.UNBOUND
+    
+    return CallableKind.SIGNATURE if specs is not None else CallableKind.OPAQUE
+
+
 class CallableInspector:
     def __init__(self):
         self.type_converter = TypeConverter()
-        self.extractors = [
-            BuiltinExtractor(),
-            UnboundMethodExtractor(),
-            BoundMethodExtractor(),
-            ClassExtractor(),
-            SignatureExtractor()
-        ]
+        self.extractors: Dict[CallableKind, ParameterExtractor] = {
+            CallableKind.BUILTIN: BuiltinExtractor(),
+            CallableKind.UNBOUND: UnboundMethodExtractor(),
+            CallableKind.BOUND: BoundMethodExtractor(),
+            CallableKind.CLASS: ClassExtractor(),
+            CallableKind.SIGNATURE: SignatureExtractor()
+        }
+        # function or class -> schema, dropped along with the callable
+        self._schemas: "weakref.WeakKeyDictionary[Callable, FunctionSchema]" = weakref.WeakKeyDictionary()
+        # __func__ -> schema of the function bound as a method; getattr hands out a new bound method
+        # every time, but its schema only depends on the function underneath
+        self._bound_schemas: "weakref.WeakKeyDictionary[Callable, FunctionSchema]" = weakref.WeakKeyDictionary()
     
     def inspect_callable(self, func: Callable) -> FunctionSchema:
+        # mcpify reaches the same functions repeatedly (re-exports, inherited methods, repeated modules),
+        # and schemas are immutable, so each callable is inspected once
+        if type(func) is types.MethodType:
+            key = func.__func__
+            cache = self._bound_schemas
+        else:
+            key = func
+            cache = self._schemas
+        # plain functions and classes hash by identity; other callables may define their own equality
+        if type(key) is not types.FunctionType and not inspect.isclass(key):
+            return self._inspect(func)
+        
+        schema = cache.get(key)
+        if schema is None:
+            schema = cache[key] = self._inspect(func)
+        return schema
+    
+    def _inspect(self, func: Callable) -> FunctionSchema:
         name = getattr(func, '__name__', str(func))
         description = getattr(func, '__doc__', None) or f"call {name}"
         
-        parameters = []
-        for extractor in self.extractors:
-            if extractor.can_handle(func):
-                parameters = extractor.extract_parameters(func, self.type_converter)
-                break
+        # builtins have fixed schemas, and inspect.signature raises for most of them anyway
+        if name in BuiltinExtractor.BUILTIN_NAMES:
+            parameters = BuiltinExtractor.BUILTIN_SCHEMAS[name]
+        else:
+            # parameters are read once and shared with the extractor;
+            # jit dispatchers (numba) expose the original function as py_func
+            specs = _parameter_specs(getattr(func, 'py_func', func))
+            extractor = self.extractors.get(_classify(func, specs))
+            parameters = extractor.extract_parameters(func, specs) if extractor else []
         
         return FunctionSchema(
             name=name,
@@ -1,5 +1,23 @@
+import inspect as _inspect
 from typing import List, Dict, Optional, Union, Set
 
+# module attributes become tools, so optional imports stay underscored
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+def _jit_and_preserve(fn):
+    """njit fn when numba is installed, keeping the metadata mcpify introspects"""
+    if _numba is None:
+        return fn
+    dispatcher = _numba.njit(cache=True)(fn)
+    dispatcher.__name__ = fn.__name__
+    dispatcher.__doc__ = fn.__doc__
+    dispatcher.__module__ = fn.__module__
+    dispatcher.__signature__ = _inspect.signature(fn)
+    return dispatcher
+
 def add(a: int, b: int) -> int:
     """add two numbers"""
     return a + b
@@ -30,6 +48,8 @@ def union_type(value: Union[int, str]) -> str:
     """handle int or string input"""
     return f"received: {value} (type: {type(value).__name__})"
 
+# float-only, so native code keeps python semantics - int tools would wrap at 64 bits
+@_jit_and_preserve
 def float_calc(x: float, y: float) -> float:
     """calculate with floats"""
     return x / y if y != 0 else 0.0
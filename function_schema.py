@@ -1,12 +1,13 @@
-from dataclasses import dataclass
-from typing import Any, Optional, List
+import sys
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Optional, List, Tuple
 from mcp.types import Tool
 
 from mcp_types import MCPType
 from schema_builders import json_schema_builder
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parameter:
     name: str
     type: MCPType
@@ -14,16 +15,42 @@ class Parameter:
     default_value: Optional[Any] = None
     description: Optional[str] = None
     is_positional: bool = False
+    
+    def __post_init__(self):
+        # descriptions like the unbound-method 'self' note repeat across many tools
+        if type(self.description) is str:
+            object.__setattr__(self, 'description', sys.intern(self.description))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionSchema:
     name: str
     description: str
     parameters: List[Parameter]
     return_type: Optional[MCPType] = None
+    _required: Tuple[Parameter, ...] = field(default=(), init=False, repr=False, compare=False)
+    _optional: Tuple[Parameter, ...] = field(default=(), init=False, repr=False, compare=False)
+    _positional: Tuple[Parameter, ...] = field(default=(), init=False, repr=False, compare=False)
+    _parameter_names: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _positional_names: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _kw_names: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _mcp_tool: Optional[Tool] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_required', tuple(p for p in self.parameters if p.is_required))
+        object.__setattr__(self, '_optional', tuple(p for p in self.parameters if not p.is_required))
+        object.__setattr__(self, '_positional', tuple(p for p in self.parameters if p.is_positional))
+        object.__setattr__(self, '_parameter_names', frozenset(p.name for p in self.parameters))
+        object.__setattr__(self, '_positional_names', tuple(p.name for p in self._positional))
+        object.__setattr__(self, '_kw_names', frozenset(p.name for p in self.parameters if not p.is_positional))
     
     def to_mcp_tool(self) -> Tool:
+        # schemas are immutable (dataclasses.replace builds a fresh cache), so build the tool once
+        if self._mcp_tool is None:
+            object.__setattr__(self, '_mcp_tool', self._build_mcp_tool())
+        return self._mcp_tool
+    
+    def _build_mcp_tool(self) -> Tool:
         properties = {}
         required = []
         
@@ -37,7 +64,7 @@ class FunctionSchema:
                 required.append(param.name)
         
         # check if this is an unbound method with self parameter
-        has_self_param = any(param.name == 'self' for param in self.parameters)
+        has_self_param = 'self' in self._parameter_names
         
         # enhance description with usage instructions for unbound methods
         enhanced_description = self.description
@@ -57,13 +84,25 @@ class FunctionSchema:
         )
     
     @property
-    def required_parameters(self) -> List[Parameter]:
-        return [p for p in self.parameters if p.is_required]
+    def required_parameters(self) -> Tuple[Parameter, ...]:
+        return self._required
+    
+    @property
+    def optional_parameters(self) -> Tuple[Parameter, ...]:
+        return self._optional
+    
+    @property
+    def positional_parameters(self) -> Tuple[Parameter, ...]:
+        return self._positional 
+    
+    @property
+    def parameter_names(self) -> FrozenSet[str]:
+        return self._parameter_names
     
     @property
-    def optional_parameters(self) -> List[Parameter]:
-        return [p for p in self.parameters if not p.is_required]
+    def positional_names(self) -> Tuple[str, ...]:
+        return self._positional_names
     
     @property
-    def positional_parameters(self) -> List[Parameter]:
-        return [p for p in self.parameters if p.is_positional] 
\ No newline at end of file
+    def kw_names(self) -> FrozenSet[str]:
+        return self._kw_names
@@ -0,0 +1,154 @@
+import json
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    # numpy arrays and scalars encode natively instead of going through str()
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _has_non_finite(value: Any) -> bool:
+        if isinstance(value, float):
+            return value - value != 0.0
+        if isinstance(value, dict):
+            return any(_has_non_finite(k) or _has_non_finite(v) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return any(map(_has_non_finite, value))
+        return False
+
+    def dumps(value: Any) -> str:
+        """encode value as json text, objects json can't represent go through str()"""
+        try:
+            encoded = orjson.dumps(value, default=str, option=_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only the stdlib encoder handles
+            return json.dumps(value, default=str)
+        # orjson writes nan and infinity as null, the stdlib keeps them as NaN/Infinity;
+        # only output containing null can hold one, so the walk is skipped otherwise
+        if b'null' in encoded and _has_non_finite(value):
+            return json.dumps(value, default=str)
+        return encoded.decode()
+else:
+    def dumps(value: Any) -> str:
+        """encode value as json text, objects json can't represent go through str()"""
+        return json.dumps(value, default=str)
+
+
+def _encode_bool(value: bool) -> str:
+    return 'true' if value else 'false'
+
+
+def _encode_none(value: None) -> str:
+    return 'null'
+
+
+def _encode_float(value: float) -> str:
+    # nan and inf have no json literal, let the backend decide what they become
+    return float.__repr__(value) if value - value == 0.0 else dumps(value)
+
+
+# exact-type encoders for scalars, producing the same text as dumps without the encoder setup
+SCALAR_ENCODERS = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: int.__repr__,
+}
+if orjson is not None:
+    # orjson leaves non-ascii text unescaped and formats floats its own way (1e16, not 1e+16)
+    SCALAR_ENCODERS[str] = json.encoder.encode_basestring
+else:
+    SCALAR_ENCODERS[str] = json.encoder.encode_basestring_ascii
+    SCALAR_ENCODERS[float] = _encode_float
+
+
+# 20+ digits can exceed 64 bits, which orjson silently reads as a float and simdjson rejects;
+# only the stdlib parser keeps such integers exact
+_WIDE_INT = re.compile(r'\d{20}')
+_WIDE_INT_BYTES = re.compile(rb'\d{20}')
+
+
+def _has_wide_int(data: Any) -> bool:
+    if len(data) < 20:
+        return False
+    if isinstance(data, str):
+        return _WIDE_INT.search(data) is not None
+    return _WIDE_INT_BYTES.search(data) is not None
+
+
+def _stdlib_loads(data: Any) -> Any:
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+# every caller materializes the whole document, where orjson is at least as fast as simdjson,
+# so simdjson only takes over parsing when orjson is missing
+if orjson is not None:
+    def loads(data: Any) -> Any:
+        """decode json text or bytes"""
+        if _has_wide_int(data):
+            return _stdlib_loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (NaN, Infinity, lone surrogate escapes), let json decide
+            return _stdlib_loads(data)
+elif simdjson is not None:
+    _parsers = threading.local()
+
+    def loads(data: Any) -> Any:
+        """decode json text or bytes"""
+        if _has_wide_int(data):
+            return _stdlib_loads(data)
+        # one parser per thread, so its internal buffers are reused across calls
+        parser = getattr(_parsers, 'parser', None)
+        if parser is None:
+            parser = _parsers.parser = simdjson.Parser()
+        try:
+            doc = parser.parse(data)
+        except ValueError:
+            # rejected input may still be json the stdlib accepts (NaN, Infinity), which also raises JSONDecodeError
+            return _stdlib_loads(data)
+        # the parser overwrites its buffers on the next parse, so materialize right away
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+else:
+    def loads(data: Any) -> Any:
+        """decode json text or bytes"""
+        return json.loads(data)
+
+
+class Codec(ABC):
+    """text encoding for tool argument bodies and results"""
+    
+    @abstractmethod
+    def encode(self, value: Any) -> str:
+        pass
+    
+    @abstractmethod
+    def decode(self, data: Any) -> Any:
+        pass
+
+
+class JsonCodec(Codec):
+    def encode(self, value: Any) -> str:
+        return dumps(value)
+    
+    def decode(self, data: Any) -> Any:
+        return loads(data)
@@ -1,7 +1,7 @@
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional, Union, Dict, Type
-import json
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union, Dict, Type
+import json_codec
 import pointer_registry
 
 
@@ -22,199 +22,312 @@ class TypeRegistry:
     @classmethod
     def clear(cls):
         """clear the registry (useful for testing)"""
+        # clear in place, _TYPE_REGISTRY_GET is bound to this dict
         cls._registry.clear()
 
 
-@dataclass(frozen=True)
-class MCPType(ABC):
-    @abstractmethod
+# envelope decoding looks types up on every object, skip the classmethod bind
+_TYPE_REGISTRY_GET = TypeRegistry._registry.get
+_SCALAR_ENCODERS_GET = json_codec.SCALAR_ENCODERS.get
+
+# envelope keys, interned once so every membership probe compares by identity first
+_MCP_PTR = sys.intern("__mcp_ptr__")
+_MCP_TYPE = sys.intern("__mcp_type__")
+_ID = sys.intern("id")
+
+
+def _decode_envelope(parsed: dict) -> Any:
+    """resolve pointer and type envelopes, other dicts come back unchanged"""
+    if _MCP_PTR in parsed:
+        obj_id = parsed.get(_ID)
+        if obj_id:
+            obj = pointer_registry.get(obj_id)
+            if obj is not None:
+                return obj
+            else:
+                raise ValueError(f"unknown object pointer: {obj_id}")
+        else:
+            raise ValueError("pointer envelope missing id")
+    
+    if _MCP_TYPE in parsed:
+        type_name = parsed[_MCP_TYPE]
+        python_type = _TYPE_REGISTRY_GET(type_name)
+        if python_type:
+            obj = python_type.__new__(python_type)
+            for key, value in parsed.items():
+                if key != _MCP_TYPE:
+                    setattr(obj, key, value)
+            return obj
+    return parsed
+
+
+class MCPType:
+    """base of all mcp types - stateless types compare equal by class"""
+    __slots__ = ()
+    is_primitive = False
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self)
+    
+    def __hash__(self) -> int:
+        return hash(type(self))
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+    
     def serialize_value(self, value: Any) -> Any:
-        pass
+        raise NotImplementedError
+    
+    def serialize_python(self, value: Any) -> Any:
+        """the json-ready python form of value, for callers that encode the result once themselves"""
+        return self.serialize_value(value)
     
-    @abstractmethod
     def deserialize_value(self, data: Any) -> Any:
-        pass
+        raise NotImplementedError
+    
+    def deserialize_python(self, obj: Any) -> Any:
+        """deserialize a value the transport already decoded from json"""
+        return self.deserialize_value(obj)
 
 
-@dataclass(frozen=True)
 class MCPPrimitive(MCPType):
-    pass
+    """scalar types - values already of the exact python type are returned without coercion"""
+    __slots__ = ()
+    is_primitive = True
+    python_type: type = object
 
 
-@dataclass(frozen=True)
 class MCPAny(MCPType):
+    __slots__ = ()
+    
     def serialize_value(self, value: Any) -> str:
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            return json.dumps(value)
-        else:
-            return json.dumps(value, default=str)
+        encode = _SCALAR_ENCODERS_GET(type(value))
+        if encode is not None:
+            return encode(value)
+        return json_codec.dumps(value)
+    
+    def serialize_python(self, value: Any) -> Any:
+        return value
     
     def deserialize_value(self, data) -> Any:
         if isinstance(data, dict):
-            parsed = data
-        else:
-            try:
-                parsed = json.loads(data)
-            except (json.JSONDecodeError, TypeError):
-                return data
-        
-        if isinstance(parsed, dict) and "__mcp_ptr__" in parsed:
-            obj_id = parsed.get("id")
-            if obj_id:
-                obj = pointer_registry.get(obj_id)
-                if obj is not None:
-                    return obj
-                else:
-                    raise ValueError(f"unknown object pointer: {obj_id}")
-            else:
-                raise ValueError("pointer envelope missing id")
-        
-        if isinstance(parsed, dict) and "__mcp_type__" in parsed:
-            type_name = parsed["__mcp_type__"]
-            python_type = TypeRegistry.get(type_name)
-            if python_type:
-                obj = python_type.__new__(python_type)
-                for key, value in parsed.items():
-                    if key != "__mcp_type__":
-                        setattr(obj, key, value)
-                return obj
-            else:
-                return parsed
+            return _decode_envelope(data)
+        try:
+            parsed = json_codec.loads(data)
+        except (json_codec.JSONDecodeError, TypeError):
+            return data
+        if isinstance(parsed, dict):
+            return _decode_envelope(parsed)
         return parsed
+    
+    def deserialize_python(self, obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return _decode_envelope(obj)
+        if isinstance(obj, list):
+            return obj
+        return self.deserialize_value(obj)
 
 
-@dataclass(frozen=True)
 class MCPInt(MCPPrimitive):
+    __slots__ = ()
+    python_type = int
+    
     def serialize_value(self, value: Any) -> int:
-        return int(value)
+        return value if type(value) is int else int(value)
+    
+    serialize_python = serialize_value
     
     def deserialize_value(self, data: Any) -> int:
-        return int(data)
+        return data if type(data) is int else int(data)
+    
+    # transport-decoded scalars take the same coercion, without an extra call
+    deserialize_python = deserialize_value
 
 
-@dataclass(frozen=True)
 class MCPFloat(MCPPrimitive):
+    __slots__ = ()
+    python_type = float
+    
     def serialize_value(self, value: Any) -> float:
-        return float(value)
+        return value if type(value) is float else float(value)
+    
+    serialize_python = serialize_value
     
     def deserialize_value(self, data: Any) -> float:
-        return float(data)
+        return data if type(data) is float else float(data)
+    
+    deserialize_python = deserialize_value
 
 
-@dataclass(frozen=True)
 class MCPString(MCPPrimitive):
+    __slots__ = ()
+    python_type = str
+    
     def serialize_value(self, value: Any) -> str:
-        return str(value)
+        return value if type(value) is str else str(value)
+    
+    serialize_python = serialize_value
     
     def deserialize_value(self, data: Any) -> str:
-        return str(data)
+        return data if type(data) is str else str(data)
+    
+    deserialize_python = deserialize_value
 
 
-@dataclass(frozen=True)
 class MCPBool(MCPPrimitive):
+    __slots__ = ()
+    python_type = bool
+    
     def serialize_value(self, value: Any) -> bool:
-        return bool(value)
+        return value if type(value) is bool else bool(value)
+    
+    serialize_python = serialize_value
     
     def deserialize_value(self, data: Any) -> bool:
-        return bool(data)
+        return data if type(data) is bool else bool(data)
+    
+    deserialize_python = deserialize_value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPArray(MCPType):
     items: MCPType
     
     def serialize_value(self, value: Any) -> str:
-        if not isinstance(value, (list, tuple)):
-            value = [value]
-        return json.dumps(value, default=str)
+        return json_codec.dumps(self.serialize_python(value))
+    
+    def serialize_python(self, value: Any) -> Any:
+        if type(value) is not list and not isinstance(value, (list, tuple)):
+            return [value]
+        return value
     
     def deserialize_value(self, data: str) -> list:
         try:
-            parsed = json.loads(data)
+            parsed = json_codec.loads(data)
             if not isinstance(parsed, list):
                 return [parsed]
             return parsed
-        except (json.JSONDecodeError, TypeError):
+        except (json_codec.JSONDecodeError, TypeError):
             return [data]
+    
+    def deserialize_python(self, obj: Any) -> Any:
+        # an already decoded list is the array itself
+        if isinstance(obj, list):
+            return obj
+        return self.deserialize_value(obj)
+
+
+@dataclass(frozen=True, slots=True)
+class MCPPrimitiveArray(MCPArray):
+    """array of int/float/str/bool items, coerced with the builtin constructor directly"""
+    _conv: Callable[[Any], Any] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_conv', _PRIMITIVE_CONVERTERS[type(self.items)])
+    
+    def serialize_python(self, value: Any) -> list:
+        if type(value) is not list and not isinstance(value, (list, tuple)):
+            value = [value]
+        # map over a builtin runs without a python frame per element
+        return list(map(self._conv, value))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPObject(MCPType):
     properties: dict[str, MCPType]
     required: list[str]
     type_name: Optional[str] = None
     description: Optional[str] = None
+    _type_tag: dict = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # the envelope tag is fixed per type, build it once
+        object.__setattr__(self, '_type_tag', {_MCP_TYPE: self.type_name} if self.type_name else {})
     
     def serialize_value(self, value: Any) -> str:
-        if hasattr(value, '__dict__'):
-            obj_dict = value.__dict__.copy()
-            if self.type_name:
-                obj_dict["__mcp_type__"] = self.type_name
-            return json.dumps(obj_dict, default=str)
-        elif isinstance(value, dict):
-            obj_dict = value.copy()
-            if self.type_name:
-                obj_dict["__mcp_type__"] = self.type_name
-            return json.dumps(obj_dict, default=str)
-        else:
-            return json.dumps({"value": value, "__mcp_type__": self.type_name or "object"}, default=str)
+        return json_codec.dumps(self.serialize_python(value))
+    
+    def serialize_python(self, value: Any) -> dict:
+        obj_dict = getattr(value, '__dict__', None)
+        if obj_dict is None:
+            if not isinstance(value, dict):
+                return {"value": value, _MCP_TYPE: self.type_name or "object"}
+            obj_dict = value
+        
+        # only a tagged type needs a merged copy, untyped objects are passed on as they are
+        type_tag = self._type_tag
+        return {**obj_dict, **type_tag} if type_tag else obj_dict
     
     def deserialize_value(self, data) -> Any:
         if isinstance(data, dict):
-            parsed = data
-        else:
-            try:
-                parsed = json.loads(data)
-            except (json.JSONDecodeError, TypeError):
-                return {"value": data}
-        
-        if isinstance(parsed, dict) and "__mcp_ptr__" in parsed:
-            obj_id = parsed.get("id")
-            if obj_id:
-                obj = pointer_registry.get(obj_id)
-                if obj is not None:
-                    return obj
-                else:
-                    raise ValueError(f"unknown object pointer: {obj_id}")
-            else:
-                raise ValueError("pointer envelope missing id")
-        
-        if isinstance(parsed, dict) and "__mcp_type__" in parsed:
-            type_name = parsed["__mcp_type__"]
-            python_type = TypeRegistry.get(type_name)
-            if python_type:
-                obj = python_type.__new__(python_type)
-                for key, value in parsed.items():
-                    if key != "__mcp_type__":
-                        setattr(obj, key, value)
-                return obj
-            else:
-                return parsed
-        elif isinstance(parsed, dict):
-            return parsed
-        else:
-            return {"value": parsed}
+            return _decode_envelope(data)
+        try:
+            parsed = json_codec.loads(data)
+        except (json_codec.JSONDecodeError, TypeError):
+            return {"value": data}
+        if isinstance(parsed, dict):
+            return _decode_envelope(parsed)
+        return {"value": parsed}
+    
+    def deserialize_python(self, obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return _decode_envelope(obj)
+        if isinstance(obj, list):
+            return {"value": obj}
+        return self.deserialize_value(obj)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPUnion(MCPType):
     variants: tuple[MCPType, ...]
+    _by_type: dict = field(default=None, init=False, repr=False, compare=False)
+    _by_tag: dict = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if len(self.variants) < 2:
             raise ValueError("union must have at least 2 variants")
+        
+        # python type -> variant, so parsed values route to a variant in one lookup
+        by_type = {}
+        # __mcp_type__ tag -> object variant, for envelopes naming their type
+        by_tag = {}
+        for variant in self.variants:
+            python_type = _PRIMITIVE_CONVERTERS.get(type(variant))
+            if python_type is not None:
+                by_type.setdefault(python_type, variant)
+            elif isinstance(variant, MCPObject):
+                by_type.setdefault(dict, variant)
+                if variant.type_name:
+                    by_tag.setdefault(variant.type_name, variant)
+            elif isinstance(variant, MCPArray):
+                by_type.setdefault(list, variant)
+        object.__setattr__(self, '_by_type', by_type)
+        object.__setattr__(self, '_by_tag', by_tag)
     
     def serialize_value(self, value: Any) -> str:
-        return json.dumps(value, default=str)
+        return json_codec.dumps(value)
+    
+    def serialize_python(self, value: Any) -> Any:
+        return value
     
     def deserialize_value(self, data: str) -> Any:
         try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+            parsed = json_codec.loads(data)
+        except (json_codec.JSONDecodeError, TypeError):
+            parsed = data
+        
+        variant = None
+        if type(parsed) is dict and self._by_tag:
+            variant = self._by_tag.get(parsed.get(_MCP_TYPE))
+        if variant is None:
+            variant = self._by_type.get(type(parsed))
+        if variant is not None:
+            # parsed is already decoded, so variants take it without another parse
+            return variant.deserialize_python(parsed)
+        return parsed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPOptional(MCPType):
     inner_type: MCPType
     
@@ -225,16 +338,28 @@ class MCPOptional(MCPType):
             return self.inner_type.serialize_value(value)
         return self.inner_type.serialize_value(value)
     
+    def serialize_python(self, value: Any) -> Any:
+        if value is None:
+            return None
+        return self.inner_type.serialize_python(value)
+    
     def deserialize_value(self, data: Any) -> Any:
         if data is None:
             return None
         if isinstance(self.inner_type, (MCPAny, MCPArray, MCPObject, MCPUnion)):
             return self.inner_type.deserialize_value(data)
         return self.inner_type.deserialize_value(data)
+    
+    def deserialize_python(self, obj: Any) -> Any:
+        if obj is None:
+            return None
+        return self.inner_type.deserialize_python(obj)
 
 
 MCP_ANY = MCPAny()
 MCP_INT = MCPInt()
 MCP_FLOAT = MCPFloat()
 MCP_STRING = MCPString()
-MCP_BOOL = MCPBool() 
\ No newline at end of file
+MCP_BOOL = MCPBool()
+
+_PRIMITIVE_CONVERTERS = {MCPInt: int, MCPFloat: float, MCPString: str, MCPBool: bool}
@@ -1,9 +1,12 @@
 import asyncio
+import functools
+import importlib
 import inspect
-import json
+import keyword
+import sys
 import types
 import pkgutil
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from mcp.server import Server, NotificationOptions
 from mcp.server.stdio import stdio_server
@@ -18,20 +21,149 @@ from mcp.types import (
 )
 
 from function_schema import FunctionSchema
-from callable_inspector import CallableInspector
+from callable_inspector import callable_inspector
 from value_serializer import ValueSerializer
 from mcp_types import TypeRegistry
+from json_codec import Codec, JsonCodec
 
 
 class ToolError(Exception):
     pass
 
 
+_MODULE_SKIP_ATTRS = frozenset({
+    '__builtins__', '__cached__', '__file__', '__loader__',
+    '__name__', '__package__', '__spec__', '__path__', '__doc__'
+})
+
+_SKIP_SUBMODULES = frozenset({'test', 'tests'})
+
+# every tool result is a single text block, fix the type once; model_construct skips validation,
+# which is safe since the type is the literal and every caller passes a str
+_text_content = functools.partial(TextContent.model_construct, type="text")
+
+
+def _call_keywords(func: Any, function_args: Dict[str, Any]) -> Any:
+    return func(**function_args)
+
+
+def _call_split(func: Any, function_args: Dict[str, Any], schema: FunctionSchema) -> Any:
+    """generic call path - positional parameters by position, the rest by keyword"""
+    positional_args = [function_args[name] for name in schema.positional_names if name in function_args]
+    remaining_kwargs = {name: function_args[name] for name in schema.kw_names & function_args.keys()}
+    return func(*positional_args, **remaining_kwargs) if remaining_kwargs else func(*positional_args)
+
+
+def _can_specialize(parameters: List[Any]) -> bool:
+    # a missing optional positional shifts the ones after it, and odd names can't be keywords
+    for param in parameters:
+        if param.is_positional and not param.is_required:
+            return False
+        if not param.is_positional and (not param.name.isidentifier() or keyword.iskeyword(param.name)):
+            return False
+    return True
+
+
+def _positional_prefix(func: Any, parameters: List[Any]) -> int:
+    """how many leading required parameters a plain function takes by position, in schema order"""
+    if type(func) is not types.FunctionType:
+        return 0
+    code = func.__code__
+    count = 0
+    for param, arg_name in zip(parameters, code.co_varnames[:code.co_argcount]):
+        if not param.is_required or param.name != arg_name:
+            break
+        count += 1
+    return count
+
+
+def _emit_caller(func: Any, schema: FunctionSchema, parameters: List[Any], deserialize: bool, fallback: Any):
+    """generate the straight-line caller - the generic shape (no fallback) collects the arguments present
+    and binds them by the schema, the specialized shape calls func directly and hands missing arguments to fallback"""
+    namespace = {'func': func, 'schema': schema, 'fallback': fallback, 'split': _call_split}
+    lines = ["def call(a):"]
+    required = [param.name for param in parameters if param.is_required]
+    if fallback is None:
+        lines.append("    args = {}")
+    else:
+        if required:
+            # missing arguments take the generic path so errors match it
+            lines.append(f"    if {' or '.join(f'{name!r} not in a' for name in required)}:")
+            lines.append("        return fallback(a)")
+        if len(required) < len(parameters):
+            lines.append("    kw = {}")
+    
+    # positional calls skip building a keyword mapping, so bind by position wherever the function allows it
+    positional_count = _positional_prefix(func, parameters) if fallback is not None else 0
+    positional_args = []
+    keyword_args = []
+    # parameters are converted in declaration order
+    for i, param in enumerate(parameters):
+        guarded = fallback is None or not param.is_required
+        indent = "        " if guarded else "    "
+        if guarded:
+            lines.append(f"    if {param.name!r} in a:")
+        if not deserialize:
+            lines.append(f"{indent}v{i} = a[{param.name!r}]")
+        elif param.type.is_primitive:
+            # the primitive types' exact-type-or-coerce rule, inline
+            namespace[f"t{i}"] = param.type.python_type
+            lines.append(f"{indent}v{i} = a[{param.name!r}]")
+            lines.append(f"{indent}if type(v{i}) is not t{i}:")
+            lines.append(f"{indent}    v{i} = t{i}(v{i})")
+        else:
+            namespace[f"d{i}"] = param.type.deserialize_python
+            lines.append(f"{indent}v{i} = d{i}(a[{param.name!r}])")
+        
+        if fallback is None:
+            lines.append(f"{indent}args[{param.name!r}] = v{i}")
+        elif not param.is_required:
+            lines.append(f"{indent}kw[{param.name!r}] = v{i}")
+        elif param.is_positional or i < positional_count:
+            positional_args.append(f"v{i}")
+        else:
+            keyword_args.append(f"{param.name}=v{i}")
+    
+    if fallback is None:
+        lines.append("    return split(func, args, schema)")
+    else:
+        if len(required) < len(parameters):
+            keyword_args.append("**kw")
+        lines.append(f"    return func({', '.join(positional_args + keyword_args)})")
+    
+    exec(compile("\n".join(lines), f"<tool:{schema.name}>", "exec"), namespace)
+    return namespace['call']
+
+
+def _build_caller(func: Any, schema: FunctionSchema, deserialize: bool):
+    """one function from an argument dict to func's result, specialized for schema's parameter shape.
+    with deserialize, the arguments are raw mcp values and go through their types first"""
+    if not deserialize and not schema.positional_parameters:
+        # python arguments to a keyword-only tool need no binding, and extra keywords reach func as before
+        return functools.partial(_call_keywords, func)
+    
+    parameters = list(schema.parameters)
+    generic = _emit_caller(func, schema, parameters, deserialize, None)
+    if not _can_specialize(parameters):
+        return generic
+    return _emit_caller(func, schema, parameters, deserialize, generic)
+
+
 class FunctionTool:
+    __slots__ = ('_func', '_schema', '_has_self', '_is_coro', '_call', '_invoke')
+    
     def __init__(self, func: Any, schema: FunctionSchema):
         self._func = func
         self._schema = schema
-        self._has_self = any(param.name == 'self' for param in self._schema.parameters)
+        self._has_self = 'self' in schema.parameter_names
+        # decided once: async functions and instances with an async __call__ return awaitables
+        self._is_coro = inspect.iscoroutinefunction(func) or (
+            not inspect.isclass(func) and inspect.iscoroutinefunction(getattr(func, '__call__', None))
+        )
+        # python arguments -> result, for direct calls
+        self._call = _build_caller(func, schema, deserialize=False)
+        # raw mcp arguments -> result, what the server calls
+        self._invoke = _build_caller(func, schema, deserialize=True)
     
     async def __call__(self, *args, **kwargs) -> Any:
         if len(args) == 1 and isinstance(args[0], dict) and not kwargs:
@@ -45,24 +177,25 @@ class FunctionTool:
         else:
             raise TypeError("pass either a single dict argument or keyword arguments, not both")
         
-        if self._schema.positional_parameters:
-            positional_args = []
-            remaining_kwargs = {}
-            for param in self._schema.parameters:
-                if param.is_positional and param.name in function_args:
-                    positional_args.append(function_args[param.name])
-                elif not param.is_positional and param.name in function_args:
-                    remaining_kwargs[param.name] = function_args[param.name]
-            return self._func(*positional_args, **remaining_kwargs) if remaining_kwargs else self._func(*positional_args)
-        return self._func(**function_args)
+        result = self._call(function_args)
+        if self._is_coro:
+            return await result
+        return result
 
 
 class ToolHolder:
+    __slots__ = ('name', 'tools', 'schemas', 'callable_inspector', '_invokers', '_tools_cache')
+    
     def __init__(self, name: str = ""):
         self.name = name
         self.tools: Dict[str, FunctionTool] = {}
         self.schemas: Dict[str, FunctionSchema] = {}
-        self.callable_inspector = CallableInspector()
+        # shared, so its schema cache spans every holder built while walking modules
+        self.callable_inspector = callable_inspector
+        # name -> (raw-argument invoker, is coroutine), everything a call needs in one lookup
+        self._invokers: Dict[str, Tuple[Any, bool]] = {}
+        # built mcp tools, reset by every mutation; a tuple so callers can't alter the cache
+        self._tools_cache: Tuple[Tool, ...] | None = None
     
     def add_tool(self, name: str, func: Any, schema: FunctionSchema):
         if not name:
@@ -79,8 +212,13 @@ class ToolHolder:
             if inspect.isclass(func):
                 TypeRegistry.register(schema.return_type.type_name, func)
         
-        self.tools[name] = FunctionTool(func, schema)
+        self._store(name, FunctionTool(func, schema), schema)
+    
+    def _store(self, name: str, tool: FunctionTool, schema: FunctionSchema):
+        self.tools[name] = tool
         self.schemas[name] = schema
+        self._invokers[name] = (tool._invoke, tool._is_coro)
+        self._tools_cache = None
     
     def __ior__(self, other: "ToolHolder"):
         if not isinstance(other, ToolHolder):
@@ -89,11 +227,17 @@ class ToolHolder:
         for name, tool in other.tools.items():
             if name in self.tools:
                 raise ToolError(f"tool '{name}' already exists")
-            self.tools[name] = tool
-            self.schemas[name] = other.schemas[name]
+            self._store(name, tool, other.schemas[name])
         
         return self
     
+    def mcp_tools(self) -> List[Tool]:
+        """the registered tools as mcp tools, rebuilt only after the holder changes"""
+        if self._tools_cache is None:
+            self._tools_cache = tuple(schema.to_mcp_tool() for schema in self.schemas.values())
+        # the mcp server may hold on to or extend the list it gets, hand out a fresh one
+        return list(self._tools_cache)
+    
     def __iadd__(self, other: "FunctionTool"):
         if not isinstance(other, FunctionTool):
             raise ToolError("expected FunctionTool")
@@ -106,69 +250,67 @@ class ToolHolder:
         if tool_name in self.tools:
             raise ToolError(f"tool '{tool_name}' already exists")
         
-        self.tools[tool_name] = other
-        self.schemas[tool_name] = other._schema
+        self._store(tool_name, other, other._schema)
         return self
 
 
 class McpifiedServer:
-    def __init__(self, name: str = "mcpify"):
+    def __init__(self, name: str = "mcpify", codec: Codec | None = None):
         self.server = Server(name)
         self.tool_holder = ToolHolder(name)
         self.value_serializer = ValueSerializer()
+        self.codec = codec if codec is not None else JsonCodec()
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
-            return [schema.to_mcp_tool() for schema in self.tool_holder.schemas.values()]
+            return self.tool_holder.mcp_tools()
         
         @self.server.call_tool()
-        async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+        async def handle_call_tool(name: str, arguments: dict | str | bytes) -> list[TextContent]:
+            entry = self.tool_holder._invokers.get(name)
+            if entry is None:
+                # answered without raising, unknown names are common from chatty clients
+                return [_text_content(text=f"error: unknown tool: {name}")]
+            invoke, is_coro = entry
+            
             try:
-                if name not in self.tool_holder.tools:
-                    raise ToolError(f"unknown tool: {name}")
-                
-                tool = self.tool_holder.tools[name]
-                schema = self.tool_holder.schemas[name]
-                
                 raw_args = arguments or {}
+                if isinstance(raw_args, (str, bytes, bytearray)):
+                    # a raw json body is parsed once, every value then takes the decoded-value path
+                    raw_args = self.codec.decode(raw_args)
                 
-                deserialized_args = {}
-                for param in schema.parameters:
-                    if param.name in raw_args:
-                        raw_value = raw_args[param.name]
-                        deserialized_args[param.name] = param.type.deserialize_value(raw_value)
-                
-                result = await tool(deserialized_args)
+                result = invoke(raw_args)
+                if is_coro:
+                    result = await result
                 
-                serialized_result = self.value_serializer.serialize(result)
-                
-                if isinstance(serialized_result, str):
-                    result_text = serialized_result
+                result_type = type(result)
+                if result_type is str:
+                    result_text = result
+                elif result_type is int or result_type is float or result_type is bool:
+                    # scalars serialize to themselves, skip the serializer's type probing
+                    result_text = self.codec.encode(result)
+                elif result is None:
+                    # procedures (setattr, mutating methods) return none, which the serializer renders as null
+                    result_text = "null"
                 else:
-                    result_text = json.dumps(serialized_result, default=str)
+                    serialized_result = self.value_serializer.serialize(result)
+                    
+                    if isinstance(serialized_result, str):
+                        result_text = serialized_result
+                    else:
+                        result_text = self.codec.encode(serialized_result)
                 
-                return [TextContent(type="text", text=result_text)]
+                return [_text_content(text=result_text)]
                     
             except Exception as e:
-                return [TextContent(type="text", text=f"error: {e}")]
+                return [_text_content(text=f"error: {e}")]
     
     def __iadd__(self, other: "FunctionTool | ToolHolder"):
+        # registration, duplicate checks and tool-list cache invalidation all live in the holder
         if isinstance(other, FunctionTool):
-            if not other._schema or not hasattr(other._schema, 'name'):
-                raise ToolError("functiontool must have a schema with name")
-            tool_name = other._schema.name
-            if not tool_name:
-                raise ToolError("tool name is required")
-            if tool_name in self.tool_holder.tools:
-                raise ToolError(f"tool '{tool_name}' already exists")
-            self.tool_holder.tools[tool_name] = other
-            self.tool_holder.schemas[tool_name] = other._schema
+            self.tool_holder += other
         elif isinstance(other, ToolHolder):
-            for name, tool in other.tools.items():
-                if name in self.tool_holder.tools:
-                    raise ToolError(f"tool '{name}' already exists")
-                self.tool_holder.tools[name] = tool
-                self.tool_holder.schemas[name] = other.schemas[name]
+            self.tool_holder |= other
         else:
             raise ToolError("expected functiontool or toolholder")
         return self
@@ -176,17 +318,13 @@ class McpifiedServer:
     def __ior__(self, other: "ToolHolder"):
         if not isinstance(other, ToolHolder):
             raise ToolError("expected toolholder")
-        
-        for name, tool in other.tools.items():
-            if name in self.tool_holder.tools:
-                raise ToolError(f"tool '{name}' already exists in target holder")
-            self.tool_holder.tools[name] = tool
-            self.tool_holder.schemas[name] = other.schemas[name]
-        
+        self.tool_holder |= other
         return self
     
-    async def run(self):
-        async with stdio_server() as (read_stream, write_stream):
+    async def run(self, transport: Callable[[], Any] = stdio_server):
+        """serve over transport - any async context manager factory yielding (read_stream, write_stream),
+        such as stdio_server (the default) or a platform-specific one like an io_uring-backed stdio"""
+        async with transport() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
@@ -201,34 +339,57 @@ class McpifiedServer:
             )
 
 
-def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_depth: int = 0, _name_prefix: str = "") -> McpifiedServer:
+def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_depth: int = 0, _name_prefix: str = "", _visited: set | None = None) -> McpifiedServer:
     if _current_depth >= max_depth:
         return McpifiedServer(server_name)
     
+    # ids of modules and classes already walked - re-exports and repeated arguments are skipped
+    if _visited is None:
+        _visited = set()
+    
     def _should_include_attribute(name: str, obj: Any) -> bool:
         if name.startswith('_'):
             return False
         
-        if isinstance(obj, types.ModuleType):
-            skip_attrs = {'__builtins__', '__cached__', '__file__', '__loader__', 
-                         '__name__', '__package__', '__spec__', '__path__', '__doc__'}
-            if name in skip_attrs:
-                return False
+        if isinstance(obj, types.ModuleType) and name in _MODULE_SKIP_ATTRS:
+            return False
         
         return callable(obj) or inspect.isclass(obj) or inspect.ismodule(obj)
     
     def _get_tool_name(base_name: str, prefix: str = "") -> str:
         return f"{prefix}-{base_name}" if prefix else base_name
     
-    def _add_module(module: types.ModuleType, name_prefix: str = "") -> ToolHolder:
+    def _add_object(obj: Any, name_prefix: str, depth: int) -> ToolHolder:
+        """dispatch one attribute found while walking a module, at the given nesting depth"""
+        if depth >= max_depth:
+            return ToolHolder()
+        try:
+            if inspect.ismodule(obj):
+                return _add_module(obj, name_prefix, depth)
+            elif inspect.isclass(obj):
+                return _add_class(obj, name_prefix)
+            elif callable(obj):
+                return _add_callable(obj, name_prefix)
+        except Exception:
+            pass
+        return ToolHolder()
+    
+    def _add_module(module: types.ModuleType, name_prefix: str = "", depth: int = _current_depth) -> ToolHolder:
         module_name = getattr(module, '__name__', 'module').split('.')[-1]
         current_prefix = _get_tool_name(module_name, name_prefix) if name_prefix else module_name
         
         tool_holder = ToolHolder(module_name)
+        if id(module) in _visited:
+            return tool_holder
+        _visited.add(id(module))
         
-        for attr_name in dir(module):
+        # a module's attributes are its __dict__: read them directly, private names dropped before any work
+        module_vars = vars(module)
+        for attr_name in sorted(module_vars):
+            if attr_name.startswith('_'):
+                continue
             try:
-                attr_obj = getattr(module, attr_name)
+                attr_obj = module_vars[attr_name]
                 if not _should_include_attribute(attr_name, attr_obj):
                     continue
                 
@@ -237,14 +398,7 @@ def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_
                     attr_obj.__module__ != module.__name__):
                     continue
                 
-                sub_server = mcpify(
-                    attr_obj, 
-                    server_name="", 
-                    max_depth=max_depth,
-                    _current_depth=_current_depth + 1,
-                    _name_prefix=current_prefix
-                )
-                tool_holder |= sub_server.tool_holder
+                tool_holder |= _add_object(attr_obj, current_prefix, depth + 1)
                 
             except (AttributeError, ImportError):
                 continue
@@ -252,9 +406,17 @@ def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_
         if hasattr(module, '__path__'):
             try:
                 for importer, modname, ispkg in pkgutil.iter_modules(module.__path__, module.__name__ + "."):
+                    # private and test submodules never contribute tools, don't pay for importing them
+                    leaf_name = modname.rpartition('.')[2]
+                    if leaf_name.startswith('_') or leaf_name in _SKIP_SUBMODULES:
+                        continue
+                    try:
+                        submodule = sys.modules.get(modname) or importlib.import_module(modname)
+                    except Exception:
+                        # a submodule that fails to import for any reason is left out, not the whole package
+                        continue
                     try:
-                        submodule = __import__(modname, fromlist=[''])
-                        sub_holder = _add_module(submodule, current_prefix)
+                        sub_holder = _add_module(submodule, current_prefix, depth)
                         tool_holder |= sub_holder
                     except (ImportError, AttributeError):
                         continue
@@ -268,7 +430,9 @@ def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_
         current_prefix = _get_tool_name(class_name, name_prefix) if name_prefix else class_name
         
         tool_holder = ToolHolder(class_name)
-        
+        if id(cls) in _visited:
+            return tool_holder
+        _visited.add(id(cls))
         
         try:
             constructor_name = _get_tool_name('new', current_prefix)
@@ -283,10 +447,15 @@ def mcpify(*objects, server_name: str = "mcpify", max_depth: int = 10, _current_
         except Exception:
             pass
         
-        for attr_name in dir(cls):
-            if not _should_include_attribute(attr_name, cls):
-                continue
-            
+        # dir() without its metaclass hooks: public names along the mro, fetched once each below
+        attr_names = sorted({
+            name
+            for klass in cls.__mro__
+            for name in vars(klass)
+            if not name.startswith('_')
+        })
+        
+        for attr_name in attr_names:
             try:
                 attr_obj = getattr(cls, attr_name)
                 
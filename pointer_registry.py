@@ -1,66 +1,68 @@
-import uuid
-import weakref
-from typing import Any, Dict, Optional, Set
+import itertools
+import secrets
+from typing import Any, Dict, Iterable, List, Optional, Set
 import threading
 
 
 class PointerRegistry:
     """manages live object instances with unique identifiers"""
+    __slots__ = ('_objects', '_lock', '_counter', '_prefix')
     
     def __init__(self):
+        # strong references: a pointer is often the only thing keeping a returned object alive
         self._objects: Dict[str, Any] = {}
-        self._finalizers: Dict[str, weakref.finalize] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # a counter makes ids unique within the registry without touching the rng per object; the random
+        # prefix, drawn once, keeps ids a client kept from an earlier server process from resolving here
+        self._counter = itertools.count()
+        self._prefix = secrets.token_hex(4) + "-"
     
     def register(self, obj: Any) -> str:
         """register an object and return its unique id"""
-        obj_id = str(uuid.uuid4())
+        # next() on itertools.count is atomic, so this needs no lock
+        obj_id = self._prefix + format(next(self._counter), 'x')
         
         with self._lock:
             self._objects[obj_id] = obj
-            
-            def cleanup(obj_id=obj_id):
-                with self._lock:
-                    self._objects.pop(obj_id, None)
-                    self._finalizers.pop(obj_id, None)
-            
-            self._finalizers[obj_id] = weakref.finalize(obj, cleanup)
         
         return obj_id
     
+    def register_many(self, objs: Iterable[Any]) -> List[str]:
+        """register several objects under one lock acquisition, ids come back in order"""
+        objs = list(objs)
+        prefix = self._prefix
+        obj_ids = [prefix + format(n, 'x') for n in itertools.islice(self._counter, len(objs))]
+        
+        with self._lock:
+            self._objects.update(zip(obj_ids, objs))
+        
+        return obj_ids
+    
     def get(self, obj_id: str) -> Optional[Any]:
         """retrieve object by id, returns none if not found"""
-        with self._lock:
-            return self._objects.get(obj_id)
+        # single dict operations on str keys are atomic under the gil, readers don't take the lock
+        return self._objects.get(obj_id)
     
     def unregister(self, obj_id: str) -> bool:
         """manually remove object from registry"""
         with self._lock:
             if obj_id in self._objects:
                 del self._objects[obj_id]
-                if obj_id in self._finalizers:
-                    self._finalizers[obj_id].detach()
-                    del self._finalizers[obj_id]
                 return True
             return False
     
     def list_ids(self) -> Set[str]:
         """return all currently registered object ids"""
-        with self._lock:
-            return set(self._objects.keys())
+        return set(self._objects)
     
     def size(self) -> int:
         """return number of registered objects"""
-        with self._lock:
-            return len(self._objects)
+        return len(self._objects)
     
     def clear(self) -> None:
         """clear all registered objects"""
         with self._lock:
-            for finalizer in self._finalizers.values():
-                finalizer.detach()
             self._objects.clear()
-            self._finalizers.clear()
 
 
 _registry = PointerRegistry()
@@ -69,6 +71,10 @@ def register(obj: Any) -> str:
     """register an object and return its unique id"""
     return _registry.register(obj)
 
+def register_many(objs: Iterable[Any]) -> List[str]:
+    """register several objects and return their ids in order"""
+    return _registry.register_many(objs)
+
 def get(obj_id: str) -> Optional[Any]:
     """retrieve object by id"""
     return _registry.get(obj_id)
@@ -1,23 +1,68 @@
+import functools
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
 from mcp_types import (
     MCPType, MCPInt, MCPFloat, MCPString, MCPBool, MCPAny,
-    MCPArray, MCPObject, MCPUnion, MCPOptional
+    MCPArray, MCPPrimitiveArray, MCPObject, MCPUnion, MCPOptional
 )
 
 
+# constant leaf schemas; builders hand out copies since callers add keys to what they get
+_ANY_SCHEMA = {"type": "string", "description": "json-serialized value of any type"}
+_INT_SCHEMA = {"type": "integer"}
+_FLOAT_SCHEMA = {"type": "number"}
+_STRING_SCHEMA = {"type": "string"}
+_BOOL_SCHEMA = {"type": "boolean"}
+_NULL_SCHEMA = {"type": "null"}
+
+
 class SchemaBuilder(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     def build(self, mcp_type: MCPType) -> Dict[str, Any]:
         pass
 
 
 class JSONSchemaBuilder(SchemaBuilder):
+    __slots__ = ('_dispatch_table', '_cached_dispatch', '_array_descriptions')
+    
+    def __init__(self):
+        # exact type -> bound builder, so dispatch is one dict lookup instead of name mangling per node
+        self._dispatch_table = {
+            MCPAny: self._build_mcpany,
+            MCPInt: self._build_mcpint,
+            MCPFloat: self._build_mcpfloat,
+            MCPString: self._build_mcpstring,
+            MCPBool: self._build_mcpbool,
+            MCPArray: self._build_mcparray,
+            MCPPrimitiveArray: self._build_mcpprimitivearray,
+            MCPObject: self._build_mcpobject,
+            MCPUnion: self._build_mcpunion,
+            MCPOptional: self._build_mcpoptional,
+        }
+        # mcp types are immutable and compare by value, so equal types (say list[int] on two parameters)
+        # share one built schema; bounded, so types from discarded tools don't stay pinned
+        self._cached_dispatch = functools.lru_cache(maxsize=1024)(self._dispatch)
+        # item class -> array description; equal array types built for different parameters share the text
+        self._array_descriptions: Dict[type, str] = {}
+    
     def build(self, mcp_type: MCPType) -> Dict[str, Any]:
-        return self._dispatch(mcp_type)
+        try:
+            schema = self._cached_dispatch(mcp_type)
+        except TypeError:
+            # objects (and types containing one) hold a properties dict and aren't hashable
+            return self._dispatch(mcp_type)
+        # callers add keys to the top level (parameter descriptions, optional notes), so hand out a copy
+        return dict(schema)
     
     def _dispatch(self, mcp_type: MCPType) -> Dict[str, Any]:
+        handler = self._dispatch_table.get(type(mcp_type))
+        if handler is not None:
+            return handler(mcp_type)
+        
+        # types outside the table still resolve by name, as a _build_<lowercased class name> method
         type_name = type(mcp_type).__name__.lower()
         method_name = f"_build_{type_name}"
         
@@ -28,40 +73,44 @@ class JSONSchemaBuilder(SchemaBuilder):
             raise ValueError(f"unsupported mcp type: {type(mcp_type)}")
     
     def _build_mcpany(self, mcp_type: MCPAny) -> Dict[str, Any]:
-        return {
-            "type": "string",
-            "description": "json-serialized value of any type"
-        }
+        return _ANY_SCHEMA.copy()
     
     def _build_mcpint(self, mcp_type: MCPInt) -> Dict[str, Any]:
-        return {"type": "integer"}
+        return _INT_SCHEMA.copy()
     
     def _build_mcpfloat(self, mcp_type: MCPFloat) -> Dict[str, Any]:
-        return {"type": "number"}
+        return _FLOAT_SCHEMA.copy()
     
     def _build_mcpstring(self, mcp_type: MCPString) -> Dict[str, Any]:
-        return {"type": "string"}
+        return _STRING_SCHEMA.copy()
     
     def _build_mcpbool(self, mcp_type: MCPBool) -> Dict[str, Any]:
-        return {"type": "boolean"}
+        return _BOOL_SCHEMA.copy()
     
     def _build_mcparray(self, mcp_type: MCPArray) -> Dict[str, Any]:
+        items_class = type(mcp_type.items)
+        description = self._array_descriptions.get(items_class)
+        if description is None:
+            description = self._array_descriptions[items_class] = f"json-serialized array with items of type: {items_class.__name__}"
         return {
             "type": "string",
-            "description": f"json-serialized array with items of type: {type(mcp_type.items).__name__}"
+            "description": description
         }
     
+    def _build_mcpprimitivearray(self, mcp_type: MCPPrimitiveArray) -> Dict[str, Any]:
+        return self._build_mcparray(mcp_type)
+    
     def _build_mcpobject(self, mcp_type: MCPObject) -> Dict[str, Any]:
         schema = {
             "type": "string",
-            "description": f"json-serialized object"
+            "description": "json-serialized object"
         }
         
         if mcp_type.type_name:
             schema["description"] += f" of type {mcp_type.type_name}"
         
         if mcp_type.properties:
-            prop_desc = ", ".join(f"{name}: {type(prop_type).__name__}" for name, prop_type in mcp_type.properties.items())
+            prop_desc = ", ".join([f"{name}: {type(prop_type).__name__}" for name, prop_type in mcp_type.properties.items()])
             schema["description"] += f" with properties: {prop_desc}"
         
         if mcp_type.description:
@@ -77,15 +126,24 @@ class JSONSchemaBuilder(SchemaBuilder):
         }
     
     def _build_mcpoptional(self, mcp_type: MCPOptional) -> Dict[str, Any]:
-        inner_schema = self.build(mcp_type.inner_type)
-        if "description" in inner_schema:
-            inner_schema["description"] += " (optional, can be null)"
-        return {
-            "anyOf": [
-                inner_schema,
-                {"type": "null"}
-            ]
-        }
+        # optional is the only type whose schema nests another, peel chains of it in a loop rather than recursing
+        depth = 1
+        inner_type = mcp_type.inner_type
+        while type(inner_type) is MCPOptional:
+            depth += 1
+            inner_type = inner_type.inner_type
+        
+        schema = self.build(inner_type)
+        for _ in range(depth):
+            if "description" in schema:
+                schema["description"] += " (optional, can be null)"
+            schema = {
+                "anyOf": [
+                    schema,
+                    _NULL_SCHEMA.copy()
+                ]
+            }
+        return schema
 
 
 json_schema_builder = JSONSchemaBuilder() 
\ No newline at end of file
@@ -0,0 +1,41 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+# interpreter-bound dispatch modules, compiled unmodified in pure-python mode when cython is available.
+# the .py sources ship alongside, so everything still imports without a compiler
+COMPILED_MODULES = [
+    'callable_inspector.py',
+    'mcp_types.py',
+    'function_schema.py',
+    'schema_builders.py',
+    'value_serializer.py',
+    'pointer_registry.py',
+]
+
+# keep annotations advisory - otherwise `int` parameters reject bool and other subclasses
+COMPILER_DIRECTIVES = {'language_level': 3, 'annotation_typing': False}
+
+
+setup(
+    name='mcpify',
+    version='1.0.0',
+    description='convert python functions into mcp tools',
+    py_modules=[
+        'mcpify',
+        'callable_inspector',
+        'function_schema',
+        'json_codec',
+        'mcp_types',
+        'pointer_registry',
+        'schema_builders',
+        'value_serializer',
+    ],
+    install_requires=['mcp'],
+    extras_require={'fast': ['orjson'], 'simdjson': ['pysimdjson']},
+    ext_modules=cythonize(COMPILED_MODULES, compiler_directives=COMPILER_DIRECTIVES) if cythonize else [],
+)
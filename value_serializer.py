@@ -1,20 +1,59 @@
-import inspect
-import json
-from typing import Any, Dict, List
-from mcp_types import MCPType, MCP_INT, MCP_FLOAT, MCP_STRING, MCP_BOOL, MCPArray, MCPObject
+from typing import Any, Dict
+from mcp_types import MCP_STRING
 from callable_inspector import TypeConverter
+import json_codec
 import pointer_registry
 
 
+# exact scalar types whose serialized form is the value itself
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool})
+
+# the converter holds no state, one instance serves every serializer
+_TYPE_CONVERTER = TypeConverter()
+
+# stands in for the id while an envelope template is encoded; "\0" can't occur in a registry id
+_ID_PLACEHOLDER = json_codec.dumps("\0")
+
+
+def _pointer_envelope(value: Any, obj_id: str, attrs: tuple) -> Dict[str, Any]:
+    return {
+        "__mcp_ptr__": True,
+        "type": value.__class__.__name__,
+        "id": obj_id,
+        "attrs": list(attrs)
+    }
+
+
 class ValueSerializer:
+    __slots__ = ('type_converter', 'use_pointers', '_envelope_cache')
+    
     def __init__(self, use_pointers: bool = True):
-        self.type_converter = TypeConverter()
+        self.type_converter = _TYPE_CONVERTER
         self.use_pointers = use_pointers
+        # (class, attribute names) -> envelope json split around the id, so repeat returns skip the encoder
+        self._envelope_cache: Dict[tuple, tuple] = {}
+    
+    def _encode_pointer(self, value: Any, obj_id: str, obj_dict: Any) -> str:
+        attrs = tuple(obj_dict)
+        key = (value.__class__, attrs)
+        template = self._envelope_cache.get(key)
+        if template is None:
+            prefix, _, suffix = json_codec.dumps(_pointer_envelope(value, "\0", attrs)).partition(_ID_PLACEHOLDER)
+            template = self._envelope_cache[key] = (prefix + '"', '"' + suffix)
+        # registry ids are hex digits and a dash, nothing in them needs escaping
+        return template[0] + obj_id + template[1]
     
     def serialize(self, value: Any) -> Any:
+        # exact scalars skip the type conversion, subclasses still go through it below
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES:
+            return value
+        if value is None:
+            return "null"
+        
         # check if value is already a pointer envelope
         if isinstance(value, dict) and "__mcp_ptr__" in value:
-            return json.dumps(value)
+            return json_codec.dumps(value)
         
         # check if value is a primitive type
         if isinstance(value, (int, float, str, bool, type(None))):
@@ -22,23 +61,24 @@ class ValueSerializer:
             return mcp_type.serialize_value(value)
         
         # check if value is a simple list or dict without custom types
-        if isinstance(value, (list, dict)) and not hasattr(value, '__class__') or value.__class__ in (list, dict):
+        if value_type is list or value_type is dict:
+            if value_type is list and self.use_pointers and value and all(
+                    type(item) not in _PRIMITIVE_TYPES and hasattr(item, '__dict__') for item in value):
+                # a list of live objects becomes a list of pointers, registered in one batch
+                obj_ids = pointer_registry.register_many(value)
+                return "[" + ",".join([self._encode_pointer(item, obj_id, item.__dict__) for item, obj_id in zip(value, obj_ids)]) + "]"
+            
+            # left as python objects, the server encodes the whole result once
             mcp_type = self.type_converter.convert_from_value(value)
-            return mcp_type.serialize_value(value)
+            return mcp_type.serialize_python(value)
         
         # for complex objects, use pointer system if enabled
-        if self.use_pointers and hasattr(value, '__dict__'):
+        obj_dict = getattr(value, '__dict__', None)
+        if self.use_pointers and obj_dict is not None:
             obj_id = pointer_registry.register(value)
-            pointer_envelope = {
-                "__mcp_ptr__": True,
-                "type": value.__class__.__name__,
-                "id": obj_id,
-                "attrs": list(value.__dict__.keys()) if hasattr(value, '__dict__') else []
-            }
-            return json.dumps(pointer_envelope)
+            return self._encode_pointer(value, obj_id, obj_dict)
         
         # fallback to original serialization
-        from mcp_types import MCP_STRING
         return MCP_STRING.serialize_value(value)
 
 